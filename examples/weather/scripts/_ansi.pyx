@@ -0,0 +1,65 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled row formatter for png_to_ascii.py.
+Build in place with: cythonize -i _ansi.pyx
+"""
+
+cdef unsigned char DIGITS[256][3]
+cdef unsigned char DIGIT_LENS[256]
+cdef unsigned char COLOR_PREFIX[7]
+
+cdef int _i
+for _i in range(256):
+    _text = str(_i).encode()
+    DIGIT_LENS[_i] = len(_text)
+    for _j in range(len(_text)):
+        DIGITS[_i][_j] = _text[_j]
+
+_prefix = b"\033[38;2;"
+for _i in range(7):
+    COLOR_PREFIX[_i] = _prefix[_i]
+
+
+cdef inline Py_ssize_t _write_decimal(unsigned char[::1] out, Py_ssize_t pos, unsigned char value) nogil:
+    cdef unsigned char k
+    for k in range(DIGIT_LENS[value]):
+        out[pos + k] = DIGITS[value][k]
+    return pos + DIGIT_LENS[value]
+
+
+def encode_row(const unsigned char[:, ::1] rgb, const unsigned char[:, ::1] chars,
+               const unsigned char[::1] new_color, unsigned char[::1] out):
+    """
+    Encode one row of characters into out, writing a 24-bit color code
+    before each character flagged in new_color. Returns the number of bytes written.
+
+    rgb: (width, 3) uint8 colors
+    chars: (width, n) UTF-8 characters, NUL-padded to n bytes
+    new_color: (width,) bool/uint8 flags
+    out: buffer of at least width * (19 + n) bytes
+    """
+    cdef Py_ssize_t width = chars.shape[0]
+    cdef Py_ssize_t char_size = chars.shape[1]
+    cdef Py_ssize_t pos = 0
+    cdef Py_ssize_t x, k
+
+    with nogil:
+        for x in range(width):
+            if new_color[x]:
+                for k in range(7):
+                    out[pos + k] = COLOR_PREFIX[k]
+                pos = _write_decimal(out, pos + 7, rgb[x, 0])
+                out[pos] = 59  # ';'
+                pos = _write_decimal(out, pos + 1, rgb[x, 1])
+                out[pos] = 59
+                pos = _write_decimal(out, pos + 1, rgb[x, 2])
+                out[pos] = 109  # 'm'
+                pos += 1
+
+            for k in range(char_size):
+                if chars[x, k] == 0:
+                    break
+                out[pos] = chars[x, k]
+                pos += 1
+
+    return pos
@@ -0,0 +1,77 @@
+"""
+Numba-compiled full mode renderer for png_to_ascii.py.
+Imported only for large colored images when numba is installed.
+"""
+
+import numpy as np
+from numba import njit, prange, set_num_threads
+
+# Worst case per pixel: "\033[38;2;255;255;255m" (19 bytes) + "█" (3 bytes)
+MAX_PIXEL_BYTES = 22
+FULL_BLOCK_BYTES = np.frombuffer('█'.encode(), dtype=np.uint8)
+COLOR_PREFIX_BYTES = np.frombuffer(b"\033[38;2;", dtype=np.uint8)
+
+
+@njit(cache=True)
+def _write_bytes(out, pos, data):
+    for i in range(data.size):
+        out[pos + i] = data[i]
+    return pos + data.size
+
+
+@njit(cache=True)
+def _write_decimal(out, pos, value):
+    if value >= 100:
+        out[pos] = 48 + value // 100
+        pos += 1
+    if value >= 10:
+        out[pos] = 48 + value // 10 % 10
+        pos += 1
+    out[pos] = 48 + value % 10
+    return pos + 1
+
+
+@njit(cache=True, parallel=True)
+def _render_full_kernel(bright, rgb, transparent, new_color, threshold, out, lengths):
+    height, width = bright.shape
+    for y in prange(height):
+        row = out[y]
+        pos = 0
+        for x in range(width):
+            if transparent[y, x]:
+                row[pos] = 32
+                pos += 1
+                continue
+
+            if new_color[y, x]:
+                pos = _write_bytes(row, pos, COLOR_PREFIX_BYTES)
+                pos = _write_decimal(row, pos, rgb[y, x, 0])
+                row[pos] = 59
+                pos = _write_decimal(row, pos + 1, rgb[y, x, 1])
+                row[pos] = 59
+                pos = _write_decimal(row, pos + 1, rgb[y, x, 2])
+                row[pos] = 109
+                pos += 1
+
+            if bright[y, x] >= threshold:
+                pos = _write_bytes(row, pos, FULL_BLOCK_BYTES)
+            else:
+                row[pos] = 32
+                pos += 1
+
+        lengths[y] = pos
+
+
+def render_full_numba(bright, rgb, transparent, new_color, threshold, threads=None):
+    """
+    Render colored full mode rows with the compiled kernel, returning a list of byte lines.
+    threads caps the kernel's worker threads (default: all cores).
+    """
+    if threads is not None:
+        set_num_threads(threads)
+
+    height, width = bright.shape
+    out = np.empty((height, width * MAX_PIXEL_BYTES), dtype=np.uint8)
+    lengths = np.empty(height, dtype=np.int64)
+    _render_full_kernel(bright, rgb, transparent, new_color, threshold, out, lengths)
+    return [out[y, :lengths[y]].tobytes() for y in range(height)]
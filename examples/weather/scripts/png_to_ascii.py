@@ -3,7 +3,11 @@
 Convert images (PNG, JPG, SVG) to ASCII art with optional color.
 Usage: python png_to_ascii.py <image> [options]
 
+Requires: pip install pillow numpy
 SVG support requires: pip install cairosvg
+Faster full mode for very large images (optional): pip install numba
+Faster colored output for large images (optional): pip install cython,
+  then build the row formatter next to this script with: cythonize -i _ansi.pyx
 
 Options:
   -w, --width WIDTH          Output width in characters (default: 100)
@@ -17,12 +21,18 @@ Options:
   --no-color, -mono         Disable ANSI color codes (plain monochrome output)
   -t, --threshold VALUE     Brightness threshold 0-255 for full/block modes (default: 128)
   -i, --invert              Invert brightness (dark pixels become blocks)
+  -j, --jobs N              Worker processes for very large images (default: 1)
 """
 
 import sys
 import argparse
 import io
-from PIL import Image, ImageEnhance
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import numpy as np
+from PIL import Image, ImageEnhance, ImageOps
 
 try:
     import cairosvg
@@ -31,29 +41,66 @@ except ImportError:
     HAS_CAIROSVG = False
 
 
-# Unicode block characters for detailed rendering
-BLOCK_CHARS = {
-    0b0000: ' ',   # Empty
-    0b0001: '▗',   # Lower right
-    0b0010: '▖',   # Lower left
-    0b0011: '▄',   # Lower half
-    0b0100: '▝',   # Upper right
-    0b0101: '▐',   # Right half
-    0b0110: '▞',   # Diagonal
-    0b0111: '▟',   # Missing upper left
-    0b1000: '▘',   # Upper left
-    0b1001: '▚',   # Diagonal inverse
-    0b1010: '▌',   # Left half
-    0b1011: '▙',   # Missing upper right
-    0b1100: '▀',   # Upper half
-    0b1101: '▜',   # Missing lower left
-    0b1110: '▛',   # Missing lower right
-    0b1111: '█',   # Full block
-}
+# Unicode block characters for detailed rendering, indexed by pattern
+BLOCK_CHARS = (
+    ' ',   # 0b0000 Empty
+    '▗',   # 0b0001 Lower right
+    '▖',   # 0b0010 Lower left
+    '▄',   # 0b0011 Lower half
+    '▝',   # 0b0100 Upper right
+    '▐',   # 0b0101 Right half
+    '▞',   # 0b0110 Diagonal
+    '▟',   # 0b0111 Missing upper left
+    '▘',   # 0b1000 Upper left
+    '▚',   # 0b1001 Diagonal inverse
+    '▌',   # 0b1010 Left half
+    '▙',   # 0b1011 Missing upper right
+    '▀',   # 0b1100 Upper half
+    '▜',   # 0b1101 Missing lower left
+    '▛',   # 0b1110 Missing lower right
+    '█',   # 0b1111 Full block
+)
+
+# Output is built as UTF-8 bytes, so the lookup tables below are encoded once here
+
+# BLOCK_CHARS as a NumPy lookup table indexed by pattern
+BLOCK_LUT = np.array([char.encode() for char in BLOCK_CHARS])
+
+FULL_BLOCK = '█'.encode()
 
 # Simple ASCII characters from darkest to brightest
 ASCII_CHARS = " .'`^\",:;Il!i><~+_-?][}{1)(|\\/tfjrxnuvczXYUJCLQ0OZmwqpdbkhao*#MW&8%B@$"
 
+# ASCII character for every brightness value 0-255
+ASCII_LUT = np.array([ASCII_CHARS[min(b * len(ASCII_CHARS) // 256, len(ASCII_CHARS) - 1)].encode()
+                      for b in range(256)])
+
+# Block shading characters for smooth gradients; SHADE_CHARS[i] covers
+# brightness from SHADE_THRESHOLDS[i - 1] up to SHADE_THRESHOLDS[i]
+SHADE_CHARS = (' ', '░', '▒', '▓', '█')
+SHADE_THRESHOLDS = np.array([32, 64, 128, 192])
+SHADE_LUT = np.array([char.encode() for char in SHADE_CHARS])
+
+# Smaller images render faster than worker processes start up
+PARALLEL_MIN_PIXELS = 1_000_000
+
+# Smaller images render fast enough without the compiled _ansi row formatter
+ANSI_EXT_MIN_PIXELS = 10_000
+
+# Smaller images render faster than numba imports (and, on the first run,
+# compiles) the full mode kernel
+NUMBA_MIN_PIXELS = 2_000_000
+
+# ANSI escape sequences, and the decimal bytes for every channel value 0-255
+COLOR_PREFIX = b"\033[38;2;"
+RESET = b"\033[0m"
+INT_BYTES = [str(i).encode() for i in range(256)]
+
+# Pieces of the 24-bit color escape sequence for every channel value 0-255
+ANSI_RED = [COLOR_PREFIX + INT_BYTES[i] + b";" for i in range(256)]
+ANSI_GREEN = [INT_BYTES[i] + b";" for i in range(256)]
+ANSI_BLUE = [INT_BYTES[i] + b"m" for i in range(256)]
+
 
 def adjust_brightness_contrast(image, brightness=0, contrast=1.0, sharpness=1.0):
     """Adjust image brightness, contrast, and sharpness."""
@@ -87,100 +134,201 @@ def resize_image(image, new_width=100, h_scale=1.0, v_scale=1.0):
     # Terminal characters are roughly twice as tall as wide
     final_height = int(aspect_ratio * new_width * 0.5 * v_scale)
 
-    return image.resize((final_width, final_height))
+    # Output is character-resolution, so bilinear is plenty and much cheaper
+    # than Pillow's default bicubic filter
+    return image.resize((final_width, final_height), Image.Resampling.BILINEAR)
 
 
-def get_brightness(pixel):
-    """Calculate brightness using luminosity formula."""
-    r, g, b = pixel[:3]
-    return int(0.299 * r + 0.587 * g + 0.114 * b)
+def rgb_to_ansi(r, g, b):
+    """Convert RGB values to ANSI 24-bit color escape sequence bytes."""
+    return ANSI_RED[r] + ANSI_GREEN[g] + ANSI_BLUE[b]
 
 
-def pixel_to_ascii(pixel):
-    """Convert a pixel's brightness to an ASCII character."""
-    brightness = get_brightness(pixel)
-    char_index = min(brightness * len(ASCII_CHARS) // 256, len(ASCII_CHARS) - 1)
-    return ASCII_CHARS[char_index]
+def color_changes(rgb, visible):
+    """
+    Mark the pixels that need a new ANSI color code.
+    A code is emitted for the first visible pixel of each row and whenever the
+    color differs from the previous visible pixel in the same row.
+    """
+    packed = ((rgb[..., 0].astype(np.uint32) << 16) |
+              (rgb[..., 1].astype(np.uint32) << 8) | rgb[..., 2])
+    indices = np.flatnonzero(visible)
+    shown = packed.ravel()[indices]
+    rows = indices // visible.shape[1]
 
+    changes = np.zeros(visible.size, dtype=bool)
+    changes[indices[:1]] = True
+    changes[indices[1:]] = (shown[1:] != shown[:-1]) | (rows[1:] != rows[:-1])
+    return changes.reshape(visible.shape)
 
-def get_block_char(pixels_2x2, threshold=128, invert=False, has_alpha=False):
+
+@functools.lru_cache(maxsize=None)
+def load_ansi_ext():
+    """Import encode_row from a prebuilt _ansi extension, or return None if it isn't built."""
+    try:
+        from _ansi import encode_row
+    except ImportError:
+        return None
+    return encode_row
+
+
+def render_rows(chars, rgb=None, new_color=None):
     """
-    Convert a 2x2 pixel block to a unicode block character.
-    pixels_2x2: list of 4 pixels in order [top-left, top-right, bottom-left, bottom-right]
+    Join a 2D array of encoded characters into lines of output bytes.
+    A color code from rgb is written before each character flagged in new_color;
+    without rgb the rows are plain monochrome text.
     """
-    # Get brightness values and track which pixels are transparent
-    brightnesses = []
-    is_transparent = []
-
-    for pixel in pixels_2x2:
-        if pixel is None:
-            brightnesses.append(0)
-            is_transparent.append(True)
-        elif has_alpha and len(pixel) >= 4 and pixel[3] < 128:
-            # Transparent pixel
-            brightnesses.append(0)
-            is_transparent.append(True)
-        else:
-            brightnesses.append(get_brightness(pixel))
-            is_transparent.append(False)
-
-    if invert:
-        brightnesses = [255 - b for b in brightnesses]
-
-    # After inversion, set transparent pixels back to 0 (won't reach threshold)
-    for i, is_trans in enumerate(is_transparent):
-        if is_trans:
-            brightnesses[i] = 0
-
-    # Calculate which quadrants are "on" based on fixed threshold
-    # This preserves maximum edge detail by using all 16 block patterns
-    pattern = 0
-    for i, brightness in enumerate(brightnesses):
-        if brightness >= threshold:
-            # Build pattern: bit 3=top-left, 2=top-right, 1=bottom-left, 0=bottom-right
-            pattern |= (1 << (3 - i))
-
-    return BLOCK_CHARS[pattern]
-
-
-def get_shade_char(avg_brightness):
-    """Convert average brightness to a shading character."""
-    # Using block shading characters for smooth gradients
-    if avg_brightness < 32:
-        return ' '
-    elif avg_brightness < 64:
-        return '░'
-    elif avg_brightness < 128:
-        return '▒'
-    elif avg_brightness < 192:
-        return '▓'
-    else:
-        return '█'
+    if rgb is None:
+        return [b"".join(char_row) for char_row in chars.tolist()]
+
+    if chars.size >= ANSI_EXT_MIN_PIXELS:
+        encode_row = load_ansi_ext()
+        if encode_row is not None:
+            return encode_rows(chars, rgb, new_color, encode_row)
+
+    lines = []
+    for char_row, color_row, new_color_row in zip(chars.tolist(), rgb.tolist(), new_color.tolist()):
+        parts = []
+        for char, (r, g, b), is_new_color in zip(char_row, color_row, new_color_row):
+            if is_new_color:
+                parts.append(rgb_to_ansi(r, g, b))
+            parts.append(char)
+        lines.append(b"".join(parts))
+    return lines
+
+
+def encode_rows(chars, rgb, new_color, encode_row):
+    """Same as render_rows with color, using the compiled _ansi.encode_row."""
+    height, width = chars.shape
+    # View each fixed-width bytes character as its NUL-padded UTF-8 bytes
+    char_bytes = np.ascontiguousarray(chars).view(np.uint8).reshape(height, width, chars.itemsize)
+    rgb = np.ascontiguousarray(rgb, dtype=np.uint8)
+    new_color = np.ascontiguousarray(new_color).view(np.uint8)
+
+    # Longest color code is "\033[38;2;255;255;255m" (19 bytes)
+    out = np.empty(width * (19 + chars.itemsize), dtype=np.uint8)
+    lines = []
+    for y in range(height):
+        length = encode_row(rgb[y], char_bytes[y], new_color[y], out)
+        lines.append(out[:length].tobytes())
+    return lines
+
+
+@functools.lru_cache(maxsize=None)
+def load_full_kernel():
+    """Import the optional Numba full mode renderer, or return None without numba."""
+    try:
+        from _full_kernel import render_full_numba
+    except ImportError:
+        return None
+    return render_full_numba
 
 
-def rgb_to_ansi(r, g, b):
-    """Convert RGB values to ANSI 24-bit color escape sequence."""
-    return f"\033[38;2;{r};{g};{b}m"
+def render_planes(bright, rgb, transparent, mode='full', threshold=128, no_color=False,
+                  kernel_threads=None):
+    """
+    Render brightness, RGB and transparency planes into a list of byte lines.
+    Brightness is expected to be inverted already if requested.
+    kernel_threads caps the threads used by the Numba kernel (default: all cores).
+    """
+    img_height, img_width = bright.shape
+
+    render_full_numba = None
+    if mode == 'full' and not no_color and bright.size >= NUMBA_MIN_PIXELS:
+        render_full_numba = load_full_kernel()
+
+    if render_full_numba is not None:
+        # Same output as the NumPy path below, rendered by the compiled kernel
+        new_color = color_changes(rgb, ~transparent)
+        ascii_art = render_full_numba(bright, rgb, transparent, new_color, threshold, kernel_threads)
+
+    elif mode == 'block':
+        # Process in 2x2 pixel blocks for unicode pattern characters
+        # Each character represents a 2x2 pixel area. Odd edges are padded
+        # with transparent pixels so the image splits evenly into blocks;
+        # even-sized images are used as-is without copying. Transparent and
+        # padded pixels are never "on", even with a threshold of 0.
+        pad = ((0, img_height % 2), (0, img_width % 2))
+        needs_pad = img_height % 2 or img_width % 2
+        opaque = ~transparent
+        on = (bright >= threshold) & opaque
+        if needs_pad:
+            opaque = np.pad(opaque, pad)
+            on = np.pad(on, pad)
+        block_height, block_width = on.shape[0] // 2, on.shape[1] // 2
+
+        # Build pattern: bit 3=top-left, 2=top-right, 1=bottom-left, 0=bottom-right
+        quads = on.reshape(block_height, 2, block_width, 2).astype(np.uint8)
+        patterns = ((quads[:, 0, :, 0] << 3) | (quads[:, 0, :, 1] << 2) |
+                    (quads[:, 1, :, 0] << 1) | quads[:, 1, :, 1])
+        chars = BLOCK_LUT[patterns]
+
+        if no_color:
+            ascii_art = render_rows(chars)
+        else:
+            # Average color of the opaque pixels in each block; fully
+            # transparent blocks are blank and need no color code
+            block_rgb = np.pad(rgb, pad + ((0, 0),)) if needs_pad else rgb
+            counts = opaque.reshape(block_height, 2, block_width, 2).sum(axis=(1, 3), dtype=np.uint16)
+            opaque_rgb = block_rgb * opaque[..., np.newaxis]
+            colors = opaque_rgb.reshape(block_height, 2, block_width, 2, 3).sum(axis=(1, 3), dtype=np.uint16)
+            colors //= np.maximum(counts, 1)[..., np.newaxis]
+            new_block_color = color_changes(colors, counts > 0)
 
+            ascii_art = render_rows(chars, colors, new_block_color)
 
-def average_color(pixels):
-    """Calculate average color from a list of pixels."""
-    valid_pixels = [p for p in pixels if p]
-    if not valid_pixels:
-        return (0, 0, 0)
+    else:
+        if mode == 'full':
+            # Simple full blocks - just use █ or space based on threshold
+            chars = np.where(bright >= threshold, FULL_BLOCK, b' ')
+        elif mode == 'shade':
+            # Use shading blocks for smooth gradients
+            chars = SHADE_LUT[np.digitize(bright, SHADE_THRESHOLDS)]
+        else:
+            # Simple ASCII mode
+            chars = ASCII_LUT[bright]
 
-    avg_r = sum(p[0] for p in valid_pixels) // len(valid_pixels)
-    avg_g = sum(p[1] for p in valid_pixels) // len(valid_pixels)
-    avg_b = sum(p[2] for p in valid_pixels) // len(valid_pixels)
-    return (avg_r, avg_g, avg_b)
+        # Transparent pixels become spaces
+        chars = np.where(transparent, b' ', chars)
+        if no_color:
+            ascii_art = render_rows(chars)
+        else:
+            # Only emit a color code when the color changes along a row
+            ascii_art = render_rows(chars, rgb, color_changes(rgb, ~transparent))
+
+    return ascii_art
+
+
+def render_parallel(bright, rgb, transparent, jobs, mode='full', threshold=128, no_color=False):
+    """Render horizontal bands of the planes in worker processes and concatenate the lines."""
+    # Block mode consumes rows in pairs, so bands must start on even rows
+    band_height = -(-bright.shape[0] // jobs)
+    if mode == 'block':
+        band_height += band_height % 2
+    starts = range(0, bright.shape[0], band_height)
+
+    # Spawn fresh workers: forking after the Numba kernel has started its
+    # thread pool can hang the interpreter at exit. Each worker already owns
+    # a band, so its kernel runs single-threaded to avoid oversubscription.
+    spawn = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=spawn) as executor:
+        bands = executor.map(
+            render_planes,
+            [bright[start:start + band_height] for start in starts],
+            [rgb[start:start + band_height] for start in starts],
+            [transparent[start:start + band_height] for start in starts],
+            repeat(mode), repeat(threshold), repeat(no_color), repeat(1),
+        )
+        return [line for band in bands for line in band]
 
 
 def image_to_colored_ascii(image_path, width=100, h_scale=1.0, v_scale=1.0,
                           brightness=0, contrast=1.0, sharpness=1.0, mode='full',
-                          no_color=False, threshold=128, invert=False):
-    """Convert image to colored ASCII art.
+                          no_color=False, threshold=128, invert=False, jobs=1):
+    """Convert image to colored ASCII art, returned as UTF-8 encoded bytes.
 
     mode: 'full' for full blocks only, 'block' for 2x2 pattern blocks, 'shade' for smooth shading, 'ascii' for text
+    jobs: number of worker processes used for images of at least PARALLEL_MIN_PIXELS
     """
     try:
         # Load image - handle SVG specially
@@ -192,8 +340,10 @@ def image_to_colored_ascii(image_path, width=100, h_scale=1.0, v_scale=1.0,
             with open(image_path, 'r') as f:
                 svg_content = f.read()
             svg_content = svg_content.replace('currentColor', 'black')
-            # Render SVG to PNG at high resolution for quality
-            png_data = cairosvg.svg2png(bytestring=svg_content.encode(), output_width=width * 4)
+            # Render SVG to PNG directly at the output width (cairo antialiases
+            # the edges); resize_image then only squashes rows to the terminal aspect
+            png_data = cairosvg.svg2png(bytestring=svg_content.encode(),
+                                        output_width=int(width * h_scale))
             image = Image.open(io.BytesIO(png_data))
         else:
             image = Image.open(image_path)
@@ -212,130 +362,33 @@ def image_to_colored_ascii(image_path, width=100, h_scale=1.0, v_scale=1.0,
         # Resize with scaling
         image = resize_image(image, width, h_scale, v_scale)
 
-        pixels = image.load()
-        img_width, img_height = image.size
-
-        ascii_art = []
-
-        if mode == 'full':
-            # Simple full blocks - just use █ or space based on brightness
-            for y in range(img_height):
-                line = ""
-                for x in range(img_width):
-                    pixel = pixels[x, y]
-
-                    # Check alpha - transparent pixels become spaces
-                    if has_alpha and len(pixel) >= 4 and pixel[3] < 128:
-                        line += ' '
-                        continue
-
-                    brightness_val = get_brightness(pixel)
-                    if invert:
-                        brightness_val = 255 - brightness_val
-
-                    # Use full block or space based on threshold
-                    char = '█' if brightness_val >= threshold else ' '
-
-                    if no_color:
-                        line += char
-                    else:
-                        r, g, b = pixel[:3]
-                        color_code = rgb_to_ansi(r, g, b)
-                        line += f"{color_code}{char}"
-
-                if not no_color:
-                    line += "\033[0m"
-                ascii_art.append(line)
+        # Let Pillow compute the brightness plane (ITU-R 601-2 luma) in C. Both
+        # planes are kept C-contiguous so row-major walks and the block-mode
+        # reshape read memory sequentially instead of copying.
+        rgb = np.ascontiguousarray(image.convert('RGB'))
+        # Invert only the brightness plane so output colors stay as they are
+        gray = image.convert('L')
+        if invert:
+            gray = ImageOps.invert(gray)
+        bright = np.ascontiguousarray(gray)
+
+        # Transparent pixels become spaces in every mode
+        if has_alpha:
+            transparent = np.asarray(image)[..., 3] < 128
+        else:
+            transparent = np.zeros(bright.shape, dtype=bool)
 
-        elif mode == 'shade':
-            # Use shading blocks for smooth gradients
-            for y in range(img_height):
-                line = ""
-                for x in range(img_width):
-                    pixel = pixels[x, y]
-
-                    # Check alpha - transparent pixels become spaces
-                    if has_alpha and len(pixel) >= 4 and pixel[3] < 128:
-                        line += ' '
-                        continue
-
-                    # Get shade character based on brightness
-                    brightness_val = get_brightness(pixel)
-                    if invert:
-                        brightness_val = 255 - brightness_val
-                    char = get_shade_char(brightness_val)
-
-                    if no_color:
-                        line += char
-                    else:
-                        r, g, b = pixel[:3]
-                        color_code = rgb_to_ansi(r, g, b)
-                        line += f"{color_code}{char}"
-
-                if not no_color:
-                    line += "\033[0m"
-                ascii_art.append(line)
-
-        elif mode == 'block':
-            # Process in 2x2 pixel blocks for unicode pattern characters
-            # Each character represents a 2x2 pixel area
-            for y in range(0, img_height, 2):
-                line = ""
-                for x in range(0, img_width, 2):
-                    # Get 2x2 block of pixels [top-left, top-right, bottom-left, bottom-right]
-                    pixels_2x2 = []
-                    coords = [(x, y), (x+1, y), (x, y+1), (x+1, y+1)]
-
-                    for px, py in coords:
-                        if px < img_width and py < img_height:
-                            pixels_2x2.append(pixels[px, py])
-                        else:
-                            pixels_2x2.append(None)
-
-                    # Get block character based on threshold
-                    char = get_block_char(pixels_2x2, threshold, invert, has_alpha)
-
-                    if no_color:
-                        line += char
-                    else:
-                        color = average_color(pixels_2x2)
-                        color_code = rgb_to_ansi(*color)
-                        line += f"{color_code}{char}"
-
-                if not no_color:
-                    line += "\033[0m"
-                ascii_art.append(line)
+        # Split large images into row bands rendered in parallel
+        if jobs > 1 and bright.size >= PARALLEL_MIN_PIXELS:
+            ascii_art = render_parallel(bright, rgb, transparent, jobs, mode, threshold, no_color)
         else:
-            # Simple ASCII mode
-            for y in range(img_height):
-                line = ""
-                for x in range(img_width):
-                    pixel = pixels[x, y]
-
-                    # Check alpha - transparent pixels become spaces
-                    if has_alpha and len(pixel) >= 4 and pixel[3] < 128:
-                        line += ' '
-                        continue
-
-                    # Get ASCII character based on brightness
-                    brightness_val = get_brightness(pixel)
-                    if invert:
-                        brightness_val = 255 - brightness_val
-                    char_index = min(brightness_val * len(ASCII_CHARS) // 256, len(ASCII_CHARS) - 1)
-                    char = ASCII_CHARS[char_index]
-
-                    if no_color:
-                        line += char
-                    else:
-                        r, g, b = pixel[:3]
-                        color_code = rgb_to_ansi(r, g, b)
-                        line += f"{color_code}{char}"
-
-                if not no_color:
-                    line += "\033[0m"
-                ascii_art.append(line)
-
-        return "\n".join(ascii_art)
+            ascii_art = render_planes(bright, rgb, transparent, mode, threshold, no_color)
+
+        # Every row starts with its own color code, so a single reset at the
+        # end is enough to restore the terminal
+        if no_color:
+            return b"\n".join(ascii_art)
+        return b"\n".join(ascii_art) + RESET
 
     except FileNotFoundError:
         print(f"Error: File '{image_path}' not found.")
@@ -374,6 +427,8 @@ def main():
                        help='Brightness threshold 0-255 for full/block modes (default: 128)')
     parser.add_argument('-i', '--invert', action='store_true',
                        help='Invert brightness (dark pixels become blocks)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                       help='Worker processes for very large images (default: 1)')
 
     args = parser.parse_args()
 
@@ -394,6 +449,10 @@ def main():
         print("Error: Threshold must be between 0 and 255")
         sys.exit(1)
 
+    if args.jobs < 1:
+        print("Error: Jobs must be at least 1")
+        sys.exit(1)
+
     # Generate ASCII art
     ascii_art = image_to_colored_ascii(
         args.image,
@@ -406,11 +465,14 @@ def main():
         mode=args.mode,
         no_color=args.no_color,
         threshold=args.threshold,
-        invert=args.invert
+        invert=args.invert,
+        jobs=args.jobs
     )
 
-    # Print to terminal
-    print(ascii_art)
+    # Write the encoded output to the terminal in one go
+    sys.stdout.buffer.write(ascii_art)
+    sys.stdout.buffer.write(b'\n')
+    sys.stdout.buffer.flush()
 
     # Save to file
     if args.output:
@@ -418,7 +480,7 @@ def main():
     else:
         output_file = args.image.rsplit('.', 1)[0] + '_ascii.txt'
 
-    with open(output_file, 'w', encoding='utf-8') as f:
+    with open(output_file, 'wb') as f:
         f.write(ascii_art)
 
     print(f"\n\nSaved to: {output_file}", file=sys.stderr)